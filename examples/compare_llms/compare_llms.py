@@ -1,24 +1,19 @@
+import hashlib
+import importlib.metadata
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from inspect_ai import eval_set
-from inspect_ai.log import list_eval_logs, read_eval_log
-from plotnine import (
-    aes,
-    coord_cartesian,
-    element_line,  # For gridlines
-    element_rect,  # For setting Y-axis limits
-    element_text,
-    facet_wrap,
-    geom_col,
-    geom_text,  # For text labels on bars
-    ggplot,
-    labs,
-    position_dodge,  # For grouping
-    scale_fill_brewer,
-    stage,  # For ColorBrewer palettes
-    theme,
-    theme_minimal,
+from inspect_ai.log import (
+    EvalLogInfo,
+    list_eval_logs,
+    read_eval_log,
+    read_eval_log_sample_summaries,
 )
 
 from inspect_evals.agentdojo import agentdojo
@@ -28,6 +23,17 @@ from inspect_evals.mmmu.mmmu import mmmu_multiple_choice, mmmu_open
 config_run_eval = False
 config_eval_limit = 100
 config_log_dir = "./logs_200"
+# chart file format: vector "pdf"/"svg" skip rasterization, "png" is rendered at config_png_dpi
+config_plot_format = "pdf"
+config_png_dpi = 150
+# number of logs read concurrently
+config_read_workers = min(32, (os.cpu_count() or 1) * 4)
+# flattened result rows of already-read logs, keyed by log path + mtime + size
+config_cache_file = os.path.join(config_log_dir, "logs_cache.parquet")
+# cached rows are rebuilt when inspect_ai or the row format changes;
+# bump _ROW_FORMAT whenever log_rows changes what it produces
+_ROW_FORMAT = 3
+_INSPECT_VERSION = importlib.metadata.version("inspect_ai")
 
 models = [
     "openai/gpt-4o-mini",
@@ -47,9 +53,127 @@ mmmu_subjects = [
     "Psychology",
 ]
 
+result_columns = [
+    "model",
+    "eval_name",
+    "dataset",
+    "subject",
+    "dataset_count",
+    "correct_count",
+    "score",
+    "metric",
+    "score_metric",
+    "value",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "created",
+]
+
+# numeric columns get real numeric blocks instead of inferred object columns
+result_dtypes = {
+    "dataset_count": "int64",
+    "correct_count": "int64",
+    "value": "float64",
+    "input_tokens": "int64",
+    "output_tokens": "int64",
+    "total_tokens": "int64",
+}
+
+
+def log_cache_key(eval_log_info: EvalLogInfo) -> str:
+    """Cache key for a log file; changes whenever the file is rewritten, or the
+    code that flattens it (row format, inspect_ai version) changes."""
+    key = (
+        f"{eval_log_info.name}|{eval_log_info.mtime}|{eval_log_info.size}"
+        f"|{_ROW_FORMAT}|{_INSPECT_VERSION}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def read_eval_log_scores(eval_log_info: EvalLogInfo):
+    """Read a log header and its sample summaries.
+    
+    For .eval logs only the header (eval spec, results, stats) and the
+    per-sample summaries (which carry the scores) are decoded; sample
+    messages, outputs and events are never parsed. A .json log is a single
+    document that both of those reads would parse in full, so it is read
+    once and its samples are used instead.
+    """
+    if not eval_log_info.name.endswith(".eval"):
+        log = read_eval_log(eval_log_info)
+        return log, log.samples
+    log = read_eval_log(eval_log_info, header_only=True)
+    samples = read_eval_log_sample_summaries(eval_log_info)
+    return log, samples
+
+
+def read_eval_logs(eval_log_infos):
+    """Read logs concurrently, yielding (log, samples) pairs in order.
+    
+    At most 2 * config_read_workers logs are read ahead of the consumer, so
+    only a bounded number of logs is held in memory at a time.
+    """
+    with ThreadPoolExecutor(max_workers=config_read_workers) as ex:
+        pending = deque()
+        for eval_log_info in eval_log_infos:
+            pending.append(ex.submit(read_eval_log_scores, eval_log_info))
+            if len(pending) >= 2 * config_read_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def log_rows(cache_key, log, samples):
+    """Flatten a log into one result row (a tuple) per score metric.
+    
+    `samples` are the log's samples or sample summaries; only their scores are read.
+    """
+    model_name = log.eval.model
+    eval_name = log.eval.task.split("/", maxsplit=1)[1]
+    dataset_name = log.eval.dataset.name
+    dataset_count = log.eval.dataset.samples
+    model_usage = log.stats.model_usage.get(model_name, {})
+    input_tokens = model_usage.input_tokens
+    output_tokens = model_usage.output_tokens
+    total_tokens = model_usage.total_tokens
+    # per-log values computed once; the loops below only read these scalars
+    samples = samples or []
+    if not samples:
+        print(f"No samples found for {log.eval.task} with model {model_name} and dataset {dataset_name} with {log.eval.dataset.samples} samples")
+    scorer_name = log.eval.scorers[0].name if samples else None
+    correct_count = sum(1 for sample in samples if sample.scores[scorer_name].value == "C")
+    subject = log.eval.task_args_passed["subjects"]
+    for score in log.results.scores:
+        score_name = score.name
+        for metric_name, metric in score.metrics.items():
+            metric_value = metric.value
+            # plain tuple in result_columns order (after the cache key), no per-row dict
+            yield (
+                cache_key,
+                model_name,
+                eval_name,
+                dataset_name,
+                subject,
+                dataset_count,
+                correct_count,
+                score_name,
+                metric_name,
+                f"{score_name}: {metric_name}",
+                metric_value,
+                input_tokens,
+                output_tokens,
+                total_tokens,
+                log.eval.created,
+            )
+
+
+# cached rows are only reused when reading existing logs
+cached = pd.DataFrame(columns=["cache_key"] + result_columns).astype(result_dtypes)
+
 # run evaluation if config_run_eval is True
 if config_run_eval is True:
-    success, logs = eval_set(
+    success, eval_logs = eval_set(
         # tasks=[agentdojo(workspace="banking"), bold()],
         tasks=[mmmu_open(subjects=subject) for subject in mmmu_subjects]
         + [mmmu_multiple_choice(subjects=subject) for subject in mmmu_subjects],
@@ -59,193 +183,161 @@ if config_run_eval is True:
     )
     if success is False:
         raise Exception("Evaluation failed")
-# read existing logs if config_run_eval is False
-else:
-    logs = []
-    for eval_log_info in list_eval_logs(log_dir=config_log_dir):
-        log = read_eval_log(eval_log_info)
-        logs.append(log)
-
-# create results dataframe
-results = pd.DataFrame(
-    columns=[
-        "model",
-        "eval_name",
-        "dataset",
-        "subject",
-        "dataset_count",
-        "correct_count",
-        "score",
-        "metric",
-        "score_metric",
-        "value",
-        "input_tokens",
-        "output_tokens",
-        "total_tokens",
-    ]
-)
-# read existing eval logs
-if logs is not None:
-    for log in logs:
-        model_name = log.eval.model
-        eval_name = log.eval.task.split("/", maxsplit=1)[1]
-        dataset_name = log.eval.dataset.name
-        dataset_count = log.eval.dataset.samples
-        model_usage = log.stats.model_usage.get(model_name, {})
-        input_tokens = model_usage.input_tokens
-        output_tokens = model_usage.output_tokens
-        total_tokens = model_usage.total_tokens
-        if not log.samples:
-            print(f"No samples found for {log.eval.task} with model {model_name} and dataset {dataset_name} with {log.eval.dataset.samples} samples")
-            correct_count = 0
-        else:
-            score_name = log.eval.scorers[0].name
-            correct_count = sum(1 for sample in log.samples if sample.scores[score_name].value == "C")
-        subject = log.eval.task_args_passed["subjects"]
-        for score in log.results.scores:
-            score_name = score.name
-            for metric_name, metric in score.metrics.items():
-                metric_value = metric.value
-                results.loc[len(results)] = {
-                    "model": model_name,
-                    "eval_name": eval_name,
-                    "dataset": dataset_name,
-                    "subject": subject,
-                    "dataset_count": dataset_count,
-                    "correct_count": correct_count,
-                    "score": score_name,
-                    "metric": metric_name,
-                    "score_metric": f"{score_name}: {metric_name}",
-                    "value": metric_value,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
-                }
+    logs = ((None, (log, log.samples)) for log in eval_logs)
+# read existing logs if config_run_eval is False, parsing only logs missing from the cache
 else:
+    log_infos = {
+        log_cache_key(eval_log_info): eval_log_info
+        for eval_log_info in list_eval_logs(log_dir=config_log_dir)
+    }
+    if os.path.exists(config_cache_file):
+        cached = pd.read_parquet(config_cache_file)
+    # drop rows of logs that were deleted or rewritten since the cache was saved
+    cache_is_stale = not cached["cache_key"].isin(log_infos.keys()).all()
+    cached = cached[cached["cache_key"].isin(log_infos.keys())]
+    cached_keys = set(cached["cache_key"])
+    missing_keys = [key for key in log_infos if key not in cached_keys]
+    # logs are streamed: each one is flattened to rows and dropped before the next is consumed
+    logs = zip(missing_keys, read_eval_logs(log_infos[key] for key in missing_keys))
+
+# build the dataframe once from the rows of all logs not found in the cache
+results = pd.DataFrame.from_records(
+    (row for cache_key, (log, samples) in logs for row in log_rows(cache_key, log, samples)),
+    columns=["cache_key"] + result_columns,
+).astype(result_dtypes)
+
+if config_run_eval is False:
+    results = pd.concat([cached, results], ignore_index=True)
+    # rewrite the cache when logs were added, rewritten or removed
+    if missing_keys or cache_is_stale:
+        results.to_parquet(config_cache_file, index=False)
+
+if results.empty:
     raise Exception("No logs found")
 
+# Label columns hold a few distinct values each, keep them as categoricals so
+# filters and sorts below compare integer codes instead of Python strings
+for column in ("model", "eval_name", "dataset", "score", "metric"):
+    results[column] = results[column].astype("category")
+# Subject is ordered alphabetically for better readability in the plot
+results["subject"] = results["subject"].astype(
+    pd.CategoricalDtype(sorted(results["subject"].unique()), ordered=True)
+)
 
 # filter for the eval of interest
 # dataset_filter = results["dataset"] == "AgentDojo"
 metric_filter = results["metric"] == "accuracy"
 results = results[metric_filter]
 
+# Reruns into the same log dir leave several logs per eval, subject and model;
+# keep the most recently created one, so each bar comes from a single log
+results = results.assign(
+    created=pd.to_datetime(results["created"], format="ISO8601", utc=True)
+).sort_values("created", kind="stable").drop_duplicates(
+    ["eval_name", "subject", "model"], keep="last"
+)
+
 # Shorten model names for better legend readability
 model_name_map = {
     "openai/gpt-4o-mini": "GPT-4o Mini",
     "mistral/mistral-small-latest": "Mistral Small",
     "anthropic/claude-haiku-4-5": "Claude Haiku 4.5",
 }
-results["model_short"] = results["model"].map(model_name_map).fillna(results["model"])
+# (renames the few categories, the per-row codes are reused as they are)
+results["model_short"] = results["model"].cat.rename_categories(
+    lambda model: model_name_map.get(model, model)
+)
 
 # Format eval names for better facet titles
 eval_name_map = {
     "mmmu_multiple_choice": "Multiple Choice",
     "mmmu_open": "Open-Ended",
 }
-results["eval_name_formatted"] = (
-    results["eval_name"].map(eval_name_map).fillna(results["eval_name"])
+results["eval_name_formatted"] = results["eval_name"].cat.rename_categories(
+    lambda eval_name: eval_name_map.get(eval_name, eval_name)
 )
 
 # Sort subjects alphabetically for better readability
 results = results.sort_values(["eval_name_formatted", "subject", "model_short"])
 
-# Convert subject to categorical to preserve alphabetical order in plot
-subject_order = sorted(results["subject"].unique())
-results["subject"] = pd.Categorical(
-    results["subject"], categories=subject_order, ordered=True
-)
+# Keep only subjects left after filtering, in alphabetical order
+results["subject"] = results["subject"].cat.remove_unused_categories()
+subject_order = list(results["subject"].cat.categories)
 
 # Create label for bar text showing "correct_count/dataset_count"
 results["bar_label"] = (
-    results["correct_count"].astype(str) + "/" + results["dataset_count"].astype(str)
+    results["correct_count"].astype("int32").astype("string")
+    + "/"
+    + results["dataset_count"].astype("int32").astype("string")
 )
 
 # add this transformation to display the value as 0
-results["value_display"] = results["value"].apply(lambda x: max(x, 0.02) if x == 0 else x)
+results["value_display"] = results["value"].mask(results["value"] == 0, 0.02)
 
 print(results)
 
-# Create a single position_dodge object to share between geom_col and geom_text
-# This ensures text labels align perfectly with their corresponding bars
-dodge_position = position_dodge(width=0.87)
-
-# Build the plot using the Grammar of Graphics
-plot = (
-    # 1. Initialize the plot and define aesthetics
-    ggplot(results, aes(x="subject", y="value_display", fill="model_short"))
-    # 2. Add the column/bar geometry
-    #    position_dodge() controls spacing between model groups (how much space each subject group takes)
-    #    width controls individual bar thickness
-    #    0.87 dodge with 0.82 bar width creates good separation with prominent, readable bars
-    + geom_col(stat="identity", position="dodge", show_legend=True)
-    # 2a. Add text labels on top of bars showing "correct_count/dataset_count"
-    + geom_text(
-        aes(
-            label="bar_label",
-            y=stage("value_display", after_scale="y+0.02")
-        ),  # Only specify label, inherit fill from main aes for proper dodging
-        position=dodge_position,  # Use the SAME dodge object as geom_col for perfect alignment
-        va="bottom",  # Vertical alignment: bottom of text at top of bar
-        size=7,  # Font size
-    )
-    # 2b. Apply ColorBrewer palette for professional, colorblind-friendly colors
-    #     "Set2" palette: pastel colors that work well for categorical data
-    + scale_fill_brewer(type="qualitative", palette="Set2")
-    # 3. Facet the plot
-    #    This creates a separate subplot for each unique value in 'eval_name_formatted'
-    + facet_wrap("~ eval_name_formatted", ncol=1)
-    # 3. Set Y-axis limits (with extra space at top for text labels)
-    + coord_cartesian(ylim=(0.0, 1.08))
-    # 4. Add labels and title
-    + labs(
-        title="MMMU Benchmark: LLM Performance Across Academic Subjects",
-        subtitle=f"Evaluating {len(models)} models on {len(mmmu_subjects)} subjects | Sample size varies: 1-29 questions per subject | {datetime.now().strftime('%B %Y')}",
-        y="Accuracy Score",
-        x="Subject",
-        fill="Model",  # Legend title for shortened model names
+# One facet (subplot) per eval, stacked vertically
+facets = list(results.groupby("eval_name_formatted", sort=True, observed=True))
+model_order = sorted(results["model_short"].unique())
+# ColorBrewer "Set2": pastel, colorblind-friendly colors for categorical data
+model_colors = dict(zip(model_order, plt.get_cmap("Set2").colors))
+x = np.arange(len(subject_order))
+# 0.82 of each subject slot is covered by bars, leaving a gap between subject groups
+bar_width = 0.82 / len(model_order)
+
+fig, axes = plt.subplots(len(facets), 1, figsize=(14, 12), squeeze=False)
+for ax, (eval_name_formatted, facet) in zip(axes[:, 0], facets):
+    # 1. One row per subject, one column per model
+    heights = facet.pivot(index="subject", columns="model_short", values="value_display").reindex(
+        index=subject_order, columns=model_order
     )
-    # 5. Apply a minimal theme
-    + theme_minimal()
-    # 6. (Optional) Customize theme elements
-    + theme(
-        # Add a border around each panel (facet)
-        panel_border=element_rect(color="gray", fill=None, size=0.5),
-        # Spacing between panels - nearly zero to reduce white space
-        panel_spacing=0.01,  # Nearly zero spacing between vertically stacked facets
-        # Add horizontal gridlines for easier value reading
-        panel_grid_major_y=element_line(
-            color="#d0d0d0", size=0.5
-        ),  # Major Y-axis gridlines
-        panel_grid_minor_y=element_line(
-            color="#e8e8e8", size=0.25
-        ),  # Minor Y-axis gridlines
-        panel_grid_major_x=element_line(color="none"),  # Remove X-axis gridlines
-        panel_grid_minor_x=element_line(color="none"),  # Remove minor X-axis gridlines
-        # Rotate x-axis labels if needed
-        axis_text_x=element_text(rotation=0, hjust=0.5),
-        # Adjust title/subtitle/axis text sizes and styling
-        plot_title=element_text(size=16, weight="bold"),  # Main title
-        plot_subtitle=element_text(
-            size=11, color="#666666"
-        ),  # Subtitle with muted color
-        axis_title=element_text(size=12),
-        axis_title_x=element_text(margin={"t": 10}),  # Add space above x-axis title
-        axis_title_y=element_text(
-            margin={"r": 10}
-        ),  # Add space to right of y-axis title
-        strip_text_x=element_text(size=14, weight="bold"),  # Facet title text
-        # Move legend to bottom with horizontal orientation
-        legend_position="bottom",
-        legend_direction="horizontal",
-        # Adjust figure dimensions for 2 vertically stacked facets
-        # Taller height to minimize white space and fill the figure area
-        figure_size=(
-            14,
-            12,
-        ),  # More height for vertical facet layout to reduce white space
+    labels = facet.pivot(index="subject", columns="model_short", values="bar_label").reindex(
+        index=subject_order, columns=model_order
     )
+    # 2. Dodged bars per model, labelled with "correct_count/dataset_count"
+    for i, model_short in enumerate(model_order):
+        offset = (i - (len(model_order) - 1) / 2) * bar_width
+        bars = ax.bar(
+            x + offset,
+            heights[model_short].fillna(0).to_numpy(),
+            bar_width,
+            color=model_colors[model_short],
+            label=model_short,
+        )
+        ax.bar_label(bars, labels=labels[model_short].fillna("").tolist(), padding=2, fontsize=7)
+    # 3. Axes: y-axis limits with extra space at top for text labels
+    ax.set_ylim(0.0, 1.08)
+    ax.set_xticks(x, subject_order)
+    ax.set_ylabel("Accuracy Score", fontsize=12, labelpad=10)
+    ax.set_title(eval_name_formatted, fontsize=14, fontweight="bold")
+    # 4. Horizontal gridlines for easier value reading, gray border around each panel
+    ax.minorticks_on()
+    ax.tick_params(axis="x", which="minor", bottom=False)
+    ax.grid(axis="y", which="major", color="#d0d0d0", linewidth=0.5)
+    ax.grid(axis="y", which="minor", color="#e8e8e8", linewidth=0.25)
+    ax.set_axisbelow(True)
+    for spine in ax.spines.values():
+        spine.set_color("gray")
+        spine.set_linewidth(0.5)
+axes[-1, 0].set_xlabel("Subject", fontsize=12, labelpad=10)
+
+# 5. Title, subtitle and a horizontal legend at the bottom
+fig.suptitle(
+    "MMMU Benchmark: LLM Performance Across Academic Subjects",
+    x=0.01, y=0.995, ha="left", va="top", fontsize=16, fontweight="bold",
+)
+# subtitle below the title, both above the panels (rect top in tight_layout below)
+fig.text(
+    0.01, 0.968,
+    f"Evaluating {len(models)} models on {len(mmmu_subjects)} subjects | Sample size varies: 1-29 questions per subject | {datetime.now().strftime('%B %Y')}",
+    ha="left", va="top", fontsize=11, color="#666666",
+)
+handles, legend_labels = axes[0, 0].get_legend_handles_labels()
+fig.legend(
+    handles, legend_labels, title="Model", loc="lower center", ncol=len(model_order), frameon=False
 )
+fig.tight_layout(rect=(0, 0.04, 1, 0.955))
 
-# 7. Save the plot
-plot.save("compare_llms_bar_chart.png", dpi=300)
+# 6. Save the plot
+fig.savefig(f"compare_llms_bar_chart.{config_plot_format}", dpi=config_png_dpi, bbox_inches="tight")
+plt.close(fig)
@@ -5,57 +5,61 @@ RAGChecker to evaluate model responses. RAGChecker provides fine-grained metrics
 including precision, recall, and F1 scores by performing claim-level analysis.
 """
 
+import functools
+
 from inspect_ai import Task, task
 from inspect_ai.dataset import Sample
 from inspect_ai.solver import generate
 
 from examples.custom_scorer.ragchecker_scorer import ragchecker_scorer
 
-# Define the evaluation dataset with 3 sample questions
-EVAL_SAMPLES = [
-    Sample(
-        id="france_capital",
-        input="What is the capital of France and how big is it?",
-        target=(
-            "The capital of France is Paris. The city proper covers an area of about 105.4 square kilometers",
-            " (40.7 square miles) with a population of over 2 million."
+# Define the evaluation dataset; samples are built on first use rather than at import
+@functools.cache
+def _eval_samples() -> tuple[Sample, ...]:
+    return (
+        Sample(
+            id="france_capital",
+            input="What is the capital of France and how big is it?",
+            target=(
+                "The capital of France is Paris. The city proper covers an area of about 105.4 square kilometers",
+                " (40.7 square miles) with a population of over 2 million."
+            ),
         ),
-    ),
-    Sample(
-        id="us_founding",
-        input="When was the United States founded as a state and how many states did it originally have?",
-        target=(
-            "The United States declared independence on July 4, 1776, and was formally "
-            "recognized as a sovereign nation with the Treaty of Paris in 1783. "
-            "It originally consisted of 13 states: Delaware, Pennsylvania, New Jersey, "
-            "Georgia, Connecticut, Massachusetts, Maryland, South Carolina, New Hampshire, "
-            "Virginia, New York, North Carolina, and Rhode Island."
+        Sample(
+            id="us_founding",
+            input="When was the United States founded as a state and how many states did it originally have?",
+            target=(
+                "The United States declared independence on July 4, 1776, and was formally "
+                "recognized as a sovereign nation with the Treaty of Paris in 1783. "
+                "It originally consisted of 13 states: Delaware, Pennsylvania, New Jersey, "
+                "Georgia, Connecticut, Massachusetts, Maryland, South Carolina, New Hampshire, "
+                "Virginia, New York, North Carolina, and Rhode Island."
+            ),
         ),
-    ),
-    Sample(
-        id="airplane_invention",
-        input="When was the airplane invented, by whom, and where?",
-        target=(
-            "The airplane was invented by the Wright brothers, Orville and Wilbur Wright, "
-            "on December 17, 1903. The first successful powered flight took place at "
-            "Kitty Hawk, North Carolina, USA. Their aircraft, the Wright Flyer, achieved "
-            "the first controlled, sustained flight of a powered, heavier-than-air aircraft."
+        Sample(
+            id="airplane_invention",
+            input="When was the airplane invented, by whom, and where?",
+            target=(
+                "The airplane was invented by the Wright brothers, Orville and Wilbur Wright, "
+                "on December 17, 1903. The first successful powered flight took place at "
+                "Kitty Hawk, North Carolina, USA. Their aircraft, the Wright Flyer, achieved "
+                "the first controlled, sustained flight of a powered, heavier-than-air aircraft."
+            ),
         ),
-    ),
-    Sample(
-        id="spanish_languages",
-        input="What are major languages spoken in Spain and which regions speak which language?",
-        target=(
-            "Spain's official language nationwide is Spanish (Castilian), yet the country recognizes"
-            "several other languages as co-official in specific autonomous communities, reflecting its rich diversity."
-            "The most prominent co-official languages are Catalan (Català), spoken in Catalonia,"
-            " the Balearic Islands, and the Valencian Community; Galician (Galego), found in Galicia and closely related to Portuguese; "
-            "and Basque (Euskara), an ancient language isolate spoken in the Basque Country and parts of Navarre. "
-            "Additionally, Aranese (Aranés), a variety of Occitan, holds co-official status in the Val d'Aran region of Catalonia, "
-            "further illustrating Spain's regional linguistic variety."
+        Sample(
+            id="spanish_languages",
+            input="What are major languages spoken in Spain and which regions speak which language?",
+            target=(
+                "Spain's official language nationwide is Spanish (Castilian), yet the country recognizes"
+                "several other languages as co-official in specific autonomous communities, reflecting its rich diversity."
+                "The most prominent co-official languages are Catalan (Català), spoken in Catalonia,"
+                " the Balearic Islands, and the Valencian Community; Galician (Galego), found in Galicia and closely related to Portuguese; "
+                "and Basque (Euskara), an ancient language isolate spoken in the Basque Country and parts of Navarre. "
+                "Additionally, Aranese (Aranés), a variety of Occitan, holds co-official status in the Val d'Aran region of Catalonia, "
+                "further illustrating Spain's regional linguistic variety."
+            ),
         ),
-    ),
-]
+    )
 
 
 @task
@@ -117,7 +121,7 @@ def custom_scorer(
         ```
     """
     return Task(
-        dataset=EVAL_SAMPLES,
+        dataset=_eval_samples(),
         solver=[generate()],
         scorer=ragchecker_scorer(
             extractor_model=extractor_model,
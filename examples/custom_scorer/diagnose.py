@@ -48,10 +48,11 @@ else:
 
 print()
 
-# Try to set method
-print("Attempting to set multiprocessing method to 'spawn'...")
+# Try to set method ('spawn' on macOS, a preloaded forkserver elsewhere)
+recommended_method = 'spawn' if sys.platform == 'darwin' else 'forkserver'
+print(f"Attempting to set multiprocessing method to '{recommended_method}'...")
 try:
-    multiprocessing.set_start_method('spawn', force=True)
+    multiprocessing.set_start_method(recommended_method, force=True)
     print(f"  ✓ Success! Method is now: {multiprocessing.get_start_method()}")
 except Exception as e:
     print(f"  ✗ Failed: {e}")
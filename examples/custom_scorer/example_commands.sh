@@ -150,7 +150,7 @@ echo $OPENAI_API_KEY
 
 # Test with a single sample (for debugging)
 # Edit custom_scorer.py to use only the first sample:
-# EVAL_SAMPLES = EVAL_SAMPLES[:1]
+# dataset=_eval_samples()[:1],
 
 #######################
 # Development Workflow
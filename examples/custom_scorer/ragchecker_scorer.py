@@ -4,18 +4,237 @@ This module implements a custom scorer that uses RAGChecker to evaluate
 precision, recall, and F1 scores for model responses based on ground truth targets.
 """
 
-from inspect_ai.scorer import Score, Scorer, Target, mean, scorer, stderr
+import asyncio
+import functools
+import os
+import threading
+
+from inspect_ai.scorer import (
+    Metric,
+    SampleScore,
+    Score,
+    Scorer,
+    Target,
+    Value,
+    mean,
+    metric,
+    scorer,
+    stderr,
+)
 from inspect_ai.solver import TaskState
 
+# Import RAGChecker once (optional dependency, scorer reports an error if missing)
+try:
+    import litellm
+    from ragchecker import RAGChecker, RAGResults
+    from ragchecker.container import RAGResult
+    from ragchecker.metrics import overall_metrics
+
+    _RC_AVAILABLE = True
+except ImportError:
+    _RC_AVAILABLE = False
+
+
+def _configure_response_cache() -> None:
+    """Cache the LiteLLM calls made by RAGChecker on disk.
+    
+    LiteLLM keys each entry by a SHA256 hash of the call parameters (model,
+    messages, temperature, max_tokens, ...). The `RAGCHECKER_CACHE`
+    environment variable selects the policy:
+    
+    - "enabled" (default): serve repeated calls from the cache, store new ones
+    - "replay": serve every call from the cache and fail on a cache miss
+    - "disabled": always call the models
+    
+    The cache directory is `RAGCHECKER_CACHE_DIR` (default ".ragchecker_cache").
+    """
+    mode = os.environ.get("RAGCHECKER_CACHE", "enabled").lower()
+    if mode not in ("enabled", "replay", "disabled"):
+        raise ValueError(
+            f"Invalid RAGCHECKER_CACHE value '{mode}', expected 'enabled', 'replay' or 'disabled'"
+        )
+    if mode == "disabled" or litellm.cache is not None:
+        return
+    
+    try:
+        litellm.enable_cache(
+            type="disk",
+            disk_cache_dir=os.environ.get("RAGCHECKER_CACHE_DIR", ".ragchecker_cache"),
+        )
+    except ImportError:
+        print("Warning: diskcache is not installed, RAGChecker responses will not be cached.")
+        return
+    
+    if mode == "replay":
+        def require_hit(get_cache):
+            @functools.wraps(get_cache)
+            def wrapper(*args, **kwargs):
+                result = get_cache(*args, **kwargs)
+                if result is None:
+                    raise RuntimeError("RAGCHECKER_CACHE=replay: response not found in cache")
+                return result
+            return wrapper
+        
+        def require_hit_async(async_get_cache):
+            @functools.wraps(async_get_cache)
+            async def wrapper(*args, **kwargs):
+                result = await async_get_cache(*args, **kwargs)
+                if result is None:
+                    raise RuntimeError("RAGCHECKER_CACHE=replay: response not found in cache")
+                return result
+            return wrapper
+        
+        litellm.cache.get_cache = require_hit(litellm.cache.get_cache)
+        litellm.cache.async_get_cache = require_hit_async(litellm.cache.async_get_cache)
+
+
+class _PromptCacheUsage:
+    """LiteLLM success callback attributing prompt and provider-cached prompt tokens to samples.
+    
+    Providers report the prompt prefix served from their prompt cache in
+    `usage.prompt_tokens_details.cached_tokens`. RAGChecker builds its
+    extractor/checker prompts internally, so each call is attributed to the
+    tracked sample whose response or ground truth appears in the call's
+    messages. Responses replayed from the LiteLLM disk cache (`cache_hit`)
+    are skipped, as no provider call was made for them.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # tracked sample key -> (texts identifying its calls, [prompt_tokens, cached_tokens])
+        self._samples: dict[int, tuple[tuple[str, ...], list[int]]] = {}
+    
+    def track(self, key: int, texts: tuple[str, ...]) -> None:
+        """Start attributing calls whose messages contain one of texts to key."""
+        with self._lock:
+            self._samples[key] = (tuple(text for text in texts if text), [0, 0])
+    
+    def untrack(self, key: int) -> tuple[int, int]:
+        """Stop tracking key and return its (prompt_tokens, cached_tokens)."""
+        with self._lock:
+            _, (prompt_tokens, cached_tokens) = self._samples.pop(key)
+        return prompt_tokens, cached_tokens
+    
+    def __call__(self, kwargs, completion_response, start_time, end_time) -> None:
+        if kwargs.get("cache_hit"):
+            return
+        usage = getattr(completion_response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        prompt = "\n".join(_message_text(message) for message in kwargs.get("messages") or [])
+        with self._lock:
+            for texts, totals in self._samples.values():
+                if any(text in prompt for text in texts):
+                    totals[0] += getattr(usage, "prompt_tokens", 0) or 0
+                    totals[1] += getattr(details, "cached_tokens", 0) or 0
+                    return
+
+
+def _message_text(message) -> str:
+    """Text of a LiteLLM chat message, whose content is a string or a list of parts."""
+    content = message.get("content") if isinstance(message, dict) else None
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(str(part.get("text", "")) for part in content if isinstance(part, dict))
+    return ""
+
+
+_prompt_cache_usage = _PromptCacheUsage()
+
+
+class _BatchedEvaluator:
+    """Collects samples from concurrent score() calls and evaluates them in batches.
+    
+    A batch is evaluated once it holds `batch_size` samples or `max_wait`
+    seconds after its first sample arrived, so RAGChecker can send many
+    claims per extractor/checker request instead of one sample at a time.
+    """
+    
+    def __init__(self, evaluator: "RAGChecker", batch_size: int, max_wait: float) -> None:
+        self._evaluator = evaluator
+        self._batch_size = batch_size
+        self._max_wait = max_wait
+        self._pending: list[tuple["RAGResult", asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # asyncio only keeps weak references to tasks, hold the running batches here
+        self._tasks: set[asyncio.Task] = set()
+    
+    async def evaluate(self, rag_result: "RAGResult") -> tuple[dict[str, float], int, int]:
+        """Queue a sample and wait for its per-sample metrics.
+        
+        Returns the metrics together with the prompt tokens of the sample's
+        extractor/checker calls and how many of them were served from the
+        provider's prompt cache.
+        """
+        _prompt_cache_usage.track(id(rag_result), (rag_result.response, rag_result.gt_answer))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((rag_result, future))
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: list[tuple["RAGResult", asyncio.Future]]) -> None:
+        rag_results = RAGResults(results=[rag_result for rag_result, _ in batch])
+        try:
+            # RAGChecker is synchronous, keep the event loop free while it runs
+            await asyncio.to_thread(self._evaluator.evaluate, rag_results, overall_metrics)
+        except Exception as e:
+            for rag_result, future in batch:
+                _prompt_cache_usage.untrack(id(rag_result))
+                if not future.done():
+                    future.set_exception(e)
+            return
+        # RAGChecker stores per-sample metrics (0-1) on each result
+        for rag_result, future in batch:
+            prompt_tokens, cached_tokens = _prompt_cache_usage.untrack(id(rag_result))
+            if not future.done():
+                future.set_result((rag_result.metrics, prompt_tokens, cached_tokens))
+
+
+@metric
+def prompt_cache_hit_rate() -> Metric:
+    """Share of the extractor/checker prompt tokens served from the provider's prompt cache.
+    
+    Reads the per-sample token counts that `ragchecker_scorer` records in the
+    score metadata, so samples are weighted by their prompt tokens.
+    """
+    def metric(scores: list[SampleScore]) -> Value:
+        prompt_tokens = cached_tokens = 0
+        for sample_score in scores:
+            metadata = sample_score.score.metadata or {}
+            prompt_tokens += metadata.get("prompt_tokens", 0)
+            cached_tokens += metadata.get("cached_prompt_tokens", 0)
+        return cached_tokens / prompt_tokens if prompt_tokens else 0.0
+    
+    return metric
+
 
 @scorer(
-    metrics={
-        "*": [mean(), stderr()], 
-    }
+    metrics=[
+        {"*": [mean(), stderr()]},
+        prompt_cache_hit_rate(),
+    ]
 )
 def ragchecker_scorer(
     extractor_model: str = "openai/gpt-4o-mini",
-    checker_model: str = "openai/gpt-4o-mini"
+    checker_model: str = "openai/gpt-4o-mini",
+    batch_size: int = 32,
+    batch_max_wait: float = 2.0,
 ) -> Scorer:
     """Create a RAGChecker-based scorer for evaluating model responses.
     
@@ -31,12 +250,23 @@ def ragchecker_scorer(
         checker_model: Model name to use for RAGChecker's claim verification.
             Defaults to "openai/gpt-4o-mini". This model verifies whether
             extracted claims are supported or contradicted.
+        batch_size: Maximum number of samples evaluated together in one
+            RAGChecker call. Defaults to 32. Samples scored concurrently
+            are grouped so extraction and checking run in batches.
+        batch_max_wait: Seconds to wait for a batch to fill before it is
+            evaluated anyway. Defaults to 2.0.
             
-    Both parameters accept any model supported by LiteLLM, including:
+    Both model parameters accept any model supported by LiteLLM, including:
     - OpenAI: "openai/gpt-4o", "openai/gpt-4o-mini", "openai/gpt-4-turbo"
     - Anthropic: "anthropic/claude-3-5-sonnet-20241022", "anthropic/claude-3-opus-20240229"
     - Other providers supported by LiteLLM
     
+    Extractor and checker responses are cached on disk, see
+    `_configure_response_cache` for the `RAGCHECKER_CACHE` policies. The
+    prompt tokens of each sample's extractor/checker calls, and how many were
+    served from the provider's prompt cache, are recorded in the score
+    metadata and reported as the `prompt_cache_hit_rate` metric.
+    
     The scorer requires:
     - OpenAI API access (via OPENAI_API_KEY environment variable)
     - RAGChecker package installed
@@ -91,6 +321,23 @@ def ragchecker_scorer(
             )
         ```
     """
+    # Set up the RAGChecker evaluator once and share it across samples,
+    # using the specified models for extraction and checking
+    evaluator = None
+    if _RC_AVAILABLE:
+        _configure_response_cache()
+        if _prompt_cache_usage not in litellm.success_callback:
+            litellm.success_callback.append(_prompt_cache_usage)
+        evaluator = _BatchedEvaluator(
+            RAGChecker(
+                extractor_name=extractor_model,
+                checker_name=checker_model,
+                batch_size_extractor=batch_size,
+                batch_size_checker=batch_size
+            ),
+            batch_size=batch_size,
+            max_wait=batch_max_wait,
+        )
     
     async def score(state: TaskState, target: Target) -> Score:
         """Score a model response using RAGChecker metrics.
@@ -102,11 +349,7 @@ def ragchecker_scorer(
         Returns:
             Score: A score object containing precision, recall, and F1 metrics.
         """
-        # Import RAGChecker (lazy import to avoid errors if not installed)
-        try:
-            from ragchecker import RAGResults, RAGChecker
-            from ragchecker.metrics import overall_metrics
-        except ImportError:
+        if evaluator is None:
             return Score(
                 value="E",
                 explanation="RAGChecker not installed. Run: pip install ragchecker",
@@ -125,49 +368,29 @@ def ragchecker_scorer(
             )
         
         try:
-            # Prepare data in RAGChecker format
-            # RAGChecker expects a specific JSON structure
-            rag_data = {
-                "results": [
-                    {
-                        "query_id": state.sample_id or "sample_1",
-                        "query": question,
-                        "gt_answer": ground_truth,
-                        "response": model_response,
-                        "retrieved_context": []  # Not using retrieval context
-                    }
-                ]
-            }
-            
-            # Initialize RAGResults from the data
-            import json
-            rag_results = RAGResults.from_json(json.dumps(rag_data))
-            
-            # Set up the RAGChecker evaluator
-            # Using specified models for extraction and checking
-            evaluator = RAGChecker(
-                extractor_name=extractor_model,
-                checker_name=checker_model,
-                batch_size_extractor=1,
-                batch_size_checker=1
+            # Queue the sample for RAGChecker (no JSON round-trip) and
+            # evaluate with overall metrics (precision, recall, F1)
+            metrics, prompt_tokens, cached_prompt_tokens = await evaluator.evaluate(
+                RAGResult(
+                    query_id=state.sample_id or "sample_1",
+                    query=question,
+                    gt_answer=ground_truth,
+                    response=model_response,
+                    retrieved_context=[]  # Not using retrieval context
+                )
             )
             
-            # Evaluate with overall metrics (precision, recall, F1)
-            evaluator.evaluate(rag_results, overall_metrics)
-            
-            # Extract the metrics
-            metrics = rag_results.metrics
-            precision = metrics.get("overall_metrics", {}).get("precision", 0.0)
-            recall = metrics.get("overall_metrics", {}).get("recall", 0.0)
-            f1 = metrics.get("overall_metrics", {}).get("f1", 0.0)
-            
             return Score(
                 value={
-                    "precision": precision / 100.0,
-                    "recall": recall / 100.0,
-                    "f1": f1 / 100.0,
+                    "precision": metrics.get("precision", 0.0),
+                    "recall": metrics.get("recall", 0.0),
+                    "f1": metrics.get("f1", 0.0),
                 },
                 answer=model_response,
+                metadata={
+                    "prompt_tokens": prompt_tokens,
+                    "cached_prompt_tokens": cached_prompt_tokens,
+                },
             )
             
         except Exception as e:
@@ -27,12 +27,13 @@ if sys.platform == 'darwin' and sys.stdout.isatty() and not os.environ.get('_REE
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
     
-    for line in proc.stdout:
-        print(line, end='', flush=True)
+    # Forward raw chunks as they arrive (no line splitting, decoding or buffering)
+    stdout_fd = sys.stdout.fileno()
+    while chunk := os.read(proc.stdout.fileno(), 65536):
+        os.write(stdout_fd, chunk)
     
     proc.wait()
     sys.exit(proc.returncode)
@@ -40,8 +41,14 @@ if sys.platform == 'darwin' and sys.stdout.isatty() and not os.environ.get('_REE
 # Import multiprocessing after environment is configured
 import multiprocessing
 
-# Set multiprocessing method (should already be set via env var)
-multiprocessing.set_start_method('spawn', force=True)
+# Set multiprocessing method: macOS needs 'spawn' (should already be set via env var).
+# Elsewhere use a forkserver with the heavy modules preloaded, so worker processes
+# are forked from it instead of re-importing inspect_ai/ragchecker/spaCy each time.
+if sys.platform == 'darwin':
+    multiprocessing.set_start_method('spawn', force=True)
+else:
+    multiprocessing.set_start_method('forkserver', force=True)
+    multiprocessing.set_forkserver_preload(['inspect_ai', 'ragchecker', 'spacy'])
 print(f"✓ Multiprocessing: {multiprocessing.get_start_method()}")
 
 
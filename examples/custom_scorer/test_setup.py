@@ -5,50 +5,51 @@ This script checks if all required dependencies are installed and configured
 correctly for running the RAGChecker custom scorer example.
 """
 
+import importlib.util
 import sys
 import os
 
 
 def check_import(module_name: str, package_name: str = None) -> bool:
-    """Check if a module can be imported."""
+    """Check if a module is installed (without importing it)."""
     package_name = package_name or module_name
-    try:
-        __import__(module_name)
+    if importlib.util.find_spec(module_name) is not None:
         print(f"✅ {package_name} is installed")
         return True
-    except ImportError:
+    else:
         print(f"❌ {package_name} is NOT installed")
         print(f"   Install with: pip install {package_name}")
         return False
 
 
 def check_spacy_model() -> bool:
-    """Check if spaCy English model is installed."""
-    try:
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
+    """Check if spaCy English model is installed (without loading the pipeline)."""
+    if importlib.util.find_spec("spacy") is None:
+        print("❌ spaCy is NOT installed")
+        print("   Install with: pip install spacy (or: uv pip install spacy)")
+        return False
+    if importlib.util.find_spec("en_core_web_sm") is not None:
         print("✅ spaCy English model (en_core_web_sm) is installed")
         return True
-    except OSError:
+    else:
         print("❌ spaCy English model (en_core_web_sm) is NOT installed")
         print("   If using uv:")
         print("   uv pip install en-core-web-sm@https://github.com/explosion/spacy-models/releases/download/en_core_web_sm-3.7.1/en_core_web_sm-3.7.1-py3-none-any.whl")
         print("   If using pip:")
         print("   python -m spacy download en_core_web_sm")
         return False
-    except ImportError:
-        print("❌ spaCy is NOT installed")
-        print("   Install with: pip install spacy (or: uv pip install spacy)")
-        return False
 
 
 def check_api_key(key_name: str) -> bool:
     """Check if an API key is set."""
     key_value = os.environ.get(key_name)
     if key_value:
-        # Show only first 8 characters for security
-        masked = key_value[:8] + "..." if len(key_value) > 8 else key_value
-        print(f"✅ {key_name} is set ({masked})")
+        if os.environ.get("INSPECT_SETUP_QUIET"):
+            # Presence only, don't display any part of the key
+            print(f"✅ {key_name} is set")
+        else:
+            # Show only first 8 characters for security
+            print(f"✅ {key_name} is set ({key_value[:8]}{'...' if len(key_value) > 8 else ''})")
         return True
     else:
         print(f"❌ {key_name} is NOT set")
@@ -81,8 +82,9 @@ def main():
     
     # Check core packages
     all_passed &= check_import("inspect_ai", "inspect-ai")
-    all_passed &= check_import("ragchecker")
-    if check_import("ragchecker"):
+    ragchecker_ok = check_import("ragchecker")
+    all_passed &= ragchecker_ok
+    if ragchecker_ok:
         check_ragchecker_version()
     all_passed &= check_import("litellm")
     all_passed &= check_import("spacy")
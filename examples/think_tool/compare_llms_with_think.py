@@ -1,29 +1,33 @@
+import functools
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import click
 
-import matplotlib.pyplot as plt
 import pandas as pd
-from plotnine import (
-    aes,
-    coord_cartesian,
-    element_line,
-    element_text,
-    geom_col,
-    geom_text,
-    ggplot,
-    labs,
-    position_dodge,
-    scale_fill_brewer,
-    stage,
-    theme,
-    theme_minimal,
-)
 
-from report_logs import read_logs_into_table  # type: ignore
+if TYPE_CHECKING:
+    import numpy as np
+
+# Plotting libraries and report_logs are imported inside the functions that use
+# them, so --help and runs that skip a plot type don't pay for loading them.
+
+# Directory of this script (cache file and visuals are stored relative to it)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Log folders produced by gaia_eval.py, e.g. logs2_gaia_level1_50_think
+_LOG_DIR_RE = re.compile(r"logs[23]?_gaia_level1_50_(default|think)$")
+
+# Maps model names to file-name-safe names, e.g. openai/gpt-4o -> openai_gpt_4o
+_MODEL_TRANS = str.maketrans({"/": "_", "-": "_"})
+
+# Columns of the cached log data used by the plots
+_USED_COLUMNS = [
+    "model", "tools", "accuracy", "total_tokens", "average_turns", "duration_seconds", "total_samples",
+]
 
 # Shared configuration for metrics
 METRIC_CONFIG = {
@@ -34,7 +38,7 @@ METRIC_CONFIG = {
         "y_label": "Accuracy",
         "lower_better": False,
         "format": "{:.0%}",
-        "format_fn": lambda x: f"{x*100:.1f}%",
+        "label_format": "{:.1%}",
         "y_limits": (0.0, 1.08),
         "add_min_value": True,
         "min_value": 0.02,
@@ -46,7 +50,10 @@ METRIC_CONFIG = {
         "y_label": "Total Tokens",
         "lower_better": True,
         "format": "{:,.0f}",
-        "format_fn": lambda x: f"{x:,.0f}",
+        "label_format": "{:,.0f}",
+        # Shown in millions in the faceted chart, where full counts overlap
+        "compact_scale": 1e6,
+        "compact_unit": "M",
         "y_limits": None,
         "add_min_value": False,
     },
@@ -57,7 +64,7 @@ METRIC_CONFIG = {
         "y_label": "Average Turns",
         "lower_better": True,
         "format": "{:.1f}",
-        "format_fn": lambda x: f"{x:.1f}",
+        "label_format": "{:.1f}",
         "y_limits": None,
         "add_min_value": False,
     },
@@ -68,38 +75,79 @@ METRIC_CONFIG = {
         "y_label": "Duration (seconds)",
         "lower_better": True,
         "format": "{:,.0f}",
-        "format_fn": lambda x: f"{x:,.0f}",
+        "label_format": "{:,.0f}",
         "y_limits": None,
         "add_min_value": False,
     },
 }
 
+# Metrics shown in the parallel coordinates plots, in axis order
+PARALLEL_COORDS_METRICS = ["accuracy", "total_tokens", "duration_seconds", "average_turns"]
+
 # Colors for tool configurations (Set2 palette)
 TOOL_COLORS = {"no think": "#66c2a5", "with think": "#fc8d62"}
 
 
+@functools.lru_cache(maxsize=1)
 def get_visuals_dir() -> str:
-    """Get the visuals directory path, creating it if necessary."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    visuals_dir = os.path.join(script_dir, "visuals")
+    """Get the visuals directory path, creating it if necessary (once per process)."""
+    visuals_dir = os.path.join(_SCRIPT_DIR, "visuals")
     os.makedirs(visuals_dir, exist_ok=True)
     return visuals_dir
 
 
+def _up_to_date(output_file: str, *deps: str) -> bool:
+    """Check if output_file exists and is at least as new as every existing dependency."""
+    return os.path.exists(output_file) and all(
+        os.path.getmtime(output_file) >= os.path.getmtime(dep) for dep in deps if os.path.exists(dep)
+    )
+
+
+def _pyplot():
+    """Import pyplot on the Agg backend (plots are only written to files)."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Prepare dataframe for plotting: sort, replace labels, set categorical ordering."""
-    df = df.sort_values(["model", "tools"]).copy()
-    df["tools"] = df["tools"].replace("default", "no think")
-    df["model"] = pd.Categorical(df["model"], categories=sorted(df["model"].unique()), ordered=True)
-    df["tools"] = pd.Categorical(df["tools"], categories=["no think", "with think"], ordered=True)
-    return df
+    """Prepare dataframe for plotting: replace labels, set categorical ordering.
+    
+    The ordered categoricals drive the plotting order, so the rows are not sorted.
+    """
+    # assign() returns a new frame with the columns replaced in one step
+    return df.assign(
+        tools=pd.Categorical(
+            df["tools"].replace("default", "no think"),
+            categories=["no think", "with think"],
+            ordered=True,
+        ),
+        model=pd.Categorical(df["model"], categories=sorted(df["model"].unique()), ordered=True),
+    )
+
+
+def parallel_coords_metric_range(df: pd.DataFrame, metrics: list[str]) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the minimum and maximum of each metric across all models, for normalization."""
+    import numpy as np
+
+    return (
+        df[metrics].min(axis=0).to_numpy(dtype=np.float64),
+        df[metrics].max(axis=0).to_numpy(dtype=np.float64),
+    )
 
 
 def create_parallel_coordinates_plot(
     df: pd.DataFrame,
     model_name: str,
-    metrics: list[str] = ["accuracy", "total_tokens", "duration_seconds", "average_turns"],
+    metrics: list[str] = PARALLEL_COORDS_METRICS,
     output_file: Optional[str] = None,
+    skip_if_newer_than: Optional[list[str]] = None,
+    model_df: Optional[pd.DataFrame] = None,
+    metric_range: Optional[tuple["np.ndarray", "np.ndarray"]] = None,
+    dpi: int = 150,
 ):
     """
     Create a parallel coordinates plot comparing 'no think' vs 'with think' for a single model.
@@ -109,13 +157,29 @@ def create_parallel_coordinates_plot(
         model_name: The model to visualize (e.g., 'anthropic/claude-sonnet-4-5')
         metrics: List of metric column names to include
         output_file: Path to save the output plot
+        skip_if_newer_than: If given, skip the plot when output_file is newer than
+            these files and this script
+        model_df: The rows of df for model_name, if already split out by the caller
+        metric_range: Minimum and maximum of each metric across all models, if
+            already computed by the caller (see parallel_coords_metric_range)
+        dpi: Resolution of the saved image
     """
+    import numpy as np
+    from matplotlib.collections import LineCollection
+
+    plt = _pyplot()
+
     if output_file is None:
-        safe_model_name = model_name.replace("/", "_").replace("-", "_")
+        safe_model_name = model_name.translate(_MODEL_TRANS)
         output_file = os.path.join(get_visuals_dir(), f"parallel_coords_{safe_model_name}.png")
     
+    if skip_if_newer_than is not None and _up_to_date(output_file, __file__, *skip_if_newer_than):
+        print(f"Plot is up to date, skipping: {output_file}")
+        return
+    
     # Filter and prepare data for the specified model
-    model_df = df[df["model"] == model_name].copy()
+    if model_df is None:
+        model_df = df[df["model"] == model_name]
     
     if model_df.empty:
         print(f"No data found for model: {model_name}")
@@ -126,68 +190,67 @@ def create_parallel_coordinates_plot(
         print(f"Need both 'default' and 'with think' data for model: {model_name}")
         return
     
-    model_df["tools"] = model_df["tools"].replace("default", "no think")
-    
-    # Prepare plot
-    fig, axes = plt.subplots(1, len(metrics) - 1, figsize=(14, 6))
-    if len(metrics) == 2:
-        axes = [axes]
-    
-    # Get data for each tools configuration
-    data_by_tools: dict[str, pd.Series] = {}
-    for tools in ["no think", "with think"]:
-        filtered = model_df[model_df["tools"] == tools]
-        if not filtered.empty:
-            data_by_tools[tools] = filtered.iloc[0]
-    
-    # Normalize data for each metric (min-max scaling)
-    normalized_data: dict[str, list[float]] = {}
-    for tools, row in data_by_tools.items():
-        normalized_data[tools] = []
-        for metric in metrics:
-            metric_min, metric_max = df[metric].min(), df[metric].max()
-            value = row[metric]
-            norm_value = (value - metric_min) / (metric_max - metric_min) if metric_max > metric_min else 0.5
-            normalized_data[tools].append(norm_value)
-    
-    # Plot on each axis segment
-    for i, ax in enumerate(axes):
-        ax.set_xlim(0, 1)
-        ax.set_ylim(-0.05, 1.05)
-        
-        # Plot lines for each tools configuration
-        for tools, norm_values in normalized_data.items():
-            ax.plot([0, 1], [norm_values[i], norm_values[i + 1]], 
-                   color=TOOL_COLORS[tools], linewidth=3, marker='o', markersize=10,
-                   label=tools if i == 0 else None, alpha=0.8)
-        
-        ax.set_xticks([])
-        ax.set_xlabel("")
-        
-        # Add value labels on the left axis
-        for tools, row in data_by_tools.items():
-            value = row[metrics[i]]
-            fmt = str(METRIC_CONFIG.get(metrics[i], {}).get("format", "{:.2f}"))
-            ax.text(-0.08, normalized_data[tools][i], fmt.format(value), 
-                   ha='right', va='center', fontsize=9, color=TOOL_COLORS[tools], fontweight='bold')
-        
-        # Add value labels on the right axis (only for last segment)
-        if i == len(axes) - 1:
-            for tools, row in data_by_tools.items():
-                value = row[metrics[i + 1]]
-                fmt = str(METRIC_CONFIG.get(metrics[i + 1], {}).get("format", "{:.2f}"))
-                ax.text(1.08, normalized_data[tools][i + 1], fmt.format(value), 
-                       ha='left', va='center', fontsize=9, color=TOOL_COLORS[tools], fontweight='bold')
-        
-        # Style the axis - hide all spines
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-        ax.set_yticks([])
-        ax.axvline(0, color='#333333', linewidth=2)
-        ax.axvline(1, color='#333333', linewidth=2)
+    # Relabel on a new Series, model_df itself is only read
+    tools_col = model_df["tools"].replace("default", "no think")
+    
+    # Prepare plot: a single axes with one vertical bar per metric at x = 0 .. len(metrics) - 1
+    fig, ax = plt.subplots(figsize=(14, 6))
+    
+    # Get data for each tools configuration (first row per configuration, one pass)
+    by_tools = {tools: group.iloc[0] for tools, group in model_df.groupby(tools_col, sort=False)}
+    data_by_tools: dict[str, pd.Series] = {
+        tools: by_tools[tools] for tools in ("no think", "with think") if tools in by_tools
+    }
+    
+    # Normalize data for each metric (min-max scaling across all models);
+    # constant metrics are placed at 0.5
+    if metric_range is None:
+        metric_range = parallel_coords_metric_range(df, metrics)
+    metric_mins, metric_maxs = metric_range
+    constant = metric_maxs <= metric_mins
+    denom = metric_maxs - metric_mins
+    denom[constant] = 1.0
+    # norm_array[tools_idx, metric_idx], rows in tools_order
+    tools_order = list(data_by_tools)
+    values = np.stack([row[metrics].to_numpy(dtype=np.float64) for row in data_by_tools.values()])
+    norm_array = (values - metric_mins) / denom
+    norm_array[:, constant] = 0.5
+    
+    # Value label format per metric
+    formats = [str(METRIC_CONFIG.get(metric, {}).get("format", "{:.2f}")) for metric in metrics]
+    
+    x = np.arange(len(metrics))
+    ax.set_xlim(0, len(metrics) - 1)
+    ax.set_ylim(-0.05, 1.05)
+    
+    # Plot one polyline and its markers for each tools configuration, as two artists in total
+    colors = [TOOL_COLORS[tools] for tools in tools_order]
+    ax.add_collection(LineCollection(
+        [np.column_stack([x, norm]) for norm in norm_array],
+        colors=colors, linewidths=3, alpha=0.8, clip_on=False,
+    ))
+    ax.scatter(
+        np.tile(x, len(tools_order)), norm_array.ravel(),
+        c=np.repeat(colors, len(metrics)), s=100, alpha=0.8, zorder=3, clip_on=False,
+    )
+    
+    # Add value labels left of each metric axis, and right of the last one
+    for ti, (tools, row) in enumerate(data_by_tools.items()):
+        for i, metric in enumerate(metrics):
+            last = i == len(metrics) - 1
+            ax.text(i + 0.08 if last else i - 0.08, norm_array[ti, i], formats[i].format(row[metric]),
+                   ha='left' if last else 'right', va='center', fontsize=9,
+                   color=TOOL_COLORS[tools], fontweight='bold')
+    
+    # Style the axis - hide all spines, draw the metric axes as vertical bars
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.vlines(x, -0.05, 1.05, color='#333333', linewidth=2, clip_on=False)
     
     # Add title and subtitle
-    short_model = model_name.split("/")[-1]
+    short_model = model_name.rpartition("/")[2]
     fig.suptitle(f"Accuracy and Costs for {short_model}: Think Tool", fontsize=16, fontweight='bold', y=0.98)
     fig.text(0.5, 0.93, "Parallel coordinates plot | GAIA level 1 | 50 samples per model | with and without the 'think' tool",
              ha='center', va='top', fontsize=10, color='#666666')
@@ -206,21 +269,88 @@ def create_parallel_coordinates_plot(
         fig.text(x_pos, 0.84, str(cfg['display']), ha='center', va='bottom', fontsize=12, fontweight='bold')
         fig.text(x_pos, 0.80, f"({direction})", ha='center', va='bottom', fontsize=9, color='#666666')
     
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.12, top=0.78, left=0.12, right=0.88)
+    # Fixed layout leaving room for the header and legend, so the figure is
+    # rendered once (no tight_layout or bbox_inches='tight' measuring pass)
+    fig.subplots_adjust(bottom=0.12, top=0.78, left=0.12, right=0.88)
     
     # Save the plot
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.savefig(output_file, dpi=dpi, facecolor='white')
+    plt.close(fig)
     print(f"\nParallel coordinates plot saved to: {output_file}")
     
     return fig
 
 
+def _draw_bar_comparison(ax, df: pd.DataFrame, metric: str, compact: bool = False) -> None:
+    """Draw dodged 'no think' / 'with think' bars per model for one metric on ax.
+    
+    Expects df as returned by prepare_dataframe (models are in category order).
+    With compact, for the smaller facet panels, the model labels drop the
+    provider prefix, the bars are labelled with the shorter axis format, and
+    metrics with a compact_scale are labelled in that unit.
+    """
+    import numpy as np
+    from matplotlib.ticker import StrMethodFormatter
+
+    config = METRIC_CONFIG.get(metric, METRIC_CONFIG["accuracy"])
+    
+    # One row per model, one column per tools configuration
+    table = (
+        df.groupby(["model", "tools"], observed=False)[metric]
+        .first()
+        .unstack("tools")
+        .reindex(columns=list(TOOL_COLORS))
+    )
+    values = table.to_numpy(dtype=float)
+    if config["add_min_value"]:
+        # show zero values as a small bar
+        display = np.where(values == 0, config["min_value"], values)
+    else:
+        display = values
+    
+    # Compact labels use the shorter axis format (whole percents are exact for 50 samples)
+    label_format = str(config["format" if compact else "label_format"]).format
+    if compact and "compact_scale" in config:
+        scale, unit = float(config["compact_scale"]), str(config["compact_unit"])
+        values, display = values / scale, display / scale
+        label_format = ("{:.1f}" + unit).format
+        ax.yaxis.set_major_formatter(StrMethodFormatter("{x:g}" + unit))
+    x = np.arange(len(table))
+    width = 0.87 / len(TOOL_COLORS)
+    for j, tools in enumerate(TOOL_COLORS):
+        offset = (j - (len(TOOL_COLORS) - 1) / 2) * width
+        bars = ax.bar(x + offset, display[:, j], width, color=TOOL_COLORS[tools], label=tools)
+        ax.bar_label(
+            bars,
+            labels=["" if np.isnan(value) else label_format(value) for value in values[:, j]],
+            padding=2,
+            fontsize=7 if compact else 8,
+        )
+    
+    model_labels = table.index.astype(str)
+    if compact:
+        model_labels = [model.rpartition("/")[2] for model in model_labels]
+    ax.set_xticks(x, model_labels, rotation=45, ha='right', rotation_mode='anchor', fontsize=9)
+    ax.set_ylabel(str(config["y_label"]), fontsize=12)
+    if config["y_limits"] is not None:
+        ax.set_ylim(*config["y_limits"])
+    
+    # Minimal style with horizontal gridlines for easier value reading
+    ax.grid(axis='y', color='#d0d0d0', linewidth=0.5)
+    ax.set_axisbelow(True)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.tick_params(length=0)
+
+
 def create_comparison_plot(
     df: pd.DataFrame, 
     metric: str = "accuracy",
-    output_file: Optional[str] = None
+    output_file: Optional[str] = None,
+    skip_if_newer_than: Optional[list[str]] = None,
+    prepared: bool = False,
+    dpi: int = 150,
+    use_plotnine: bool = False,
 ):
     """
     Create a bar chart comparing model performance with 'think' vs 'no think' tools.
@@ -229,10 +359,19 @@ def create_comparison_plot(
         df: DataFrame with columns: model, tools, and the specified metric
         metric: The column name to compare (e.g., 'accuracy', 'total_tokens', 'average_turns', 'duration_seconds')
         output_file: Path to save the output plot (defaults to visuals directory)
+        skip_if_newer_than: If given, skip the plot when output_file is newer than
+            these files and this script
+        prepared: If True, df was already passed through prepare_dataframe
+        dpi: Resolution of the saved image
+        use_plotnine: Render with plotnine instead of drawing the bars with matplotlib
     """
     if output_file is None:
         output_file = os.path.join(get_visuals_dir(), f"compare_{metric}.png")
     
+    if skip_if_newer_than is not None and _up_to_date(output_file, __file__, *skip_if_newer_than):
+        print(f"Plot is up to date, skipping: {output_file}")
+        return
+    
     if df.empty:
         print("No data to plot")
         return
@@ -241,20 +380,73 @@ def create_comparison_plot(
         print(f"Error: Metric '{metric}' not found in dataframe")
         return
     
-    df = prepare_dataframe(df)
+    if not prepared:
+        df = prepare_dataframe(df)
+    
+    print(f"\nData to plot ({metric}):")
+    print(df[["model", "tools", metric, "total_samples"]])
+    
+    if use_plotnine:
+        plot = _plotnine_comparison_plot(df, metric, output_file, dpi)
+        print(f"\nPlot saved to: {output_file}")
+        return plot
+    
+    plt = _pyplot()
     config = METRIC_CONFIG.get(metric, METRIC_CONFIG["accuracy"])
     
-    # Create display column and labels
-    df["metric_display"] = df[metric]
-    if config["add_min_value"]:
-        df["metric_display"] = df["metric_display"].apply(
-            lambda x: max(x, config["min_value"]) if x == 0 else x
-        )
+    fig, ax = plt.subplots(figsize=(12, 8))
+    _draw_bar_comparison(ax, df, metric)
     
-    df["metric_label"] = df[metric].apply(config["format_fn"])  # type: ignore
+    # Add title, subtitle and legend
+    fig.suptitle(str(config["title"]), fontsize=16, fontweight='bold', y=0.98)
+    fig.text(0.5, 0.93, f"{config['subtitle_direction']} | 50 samples per model | with and without the 'think' tool | {datetime.now().strftime('%B %d, %Y')}",
+             ha='center', va='top', fontsize=11, color='#666666')
+    fig.legend(*ax.get_legend_handles_labels(), loc='lower center', ncol=2, fontsize=11, frameon=False)
+    fig.subplots_adjust(bottom=0.28, top=0.88, left=0.08, right=0.97)
     
-    print(f"\nData to plot ({metric}):")
-    print(df[["model", "tools", metric, "total_samples"]])
+    # Save the plot
+    fig.savefig(output_file, dpi=dpi, facecolor='white')
+    plt.close(fig)
+    print(f"\nPlot saved to: {output_file}")
+    
+    return fig
+
+
+def _plotnine_comparison_plot(df: pd.DataFrame, metric: str, output_file: str, dpi: int):
+    """Save the bar chart of create_comparison_plot with plotnine (ggplot styling)."""
+    from plotnine import (
+        aes,
+        coord_cartesian,
+        element_line,
+        element_text,
+        geom_col,
+        geom_text,
+        ggplot,
+        labs,
+        position_dodge,
+        scale_fill_brewer,
+        theme,
+        theme_minimal,
+    )
+    import numpy as np
+
+    config = METRIC_CONFIG.get(metric, METRIC_CONFIG["accuracy"])
+    
+    # Create display column and labels
+    values = df[metric].to_numpy()
+    if config["add_min_value"]:
+        # show zero values as a small bar
+        display = np.where(values == 0, config["min_value"], values)
+    else:
+        display = values
+    
+    label_format = str(config["label_format"]).format
+    df = df.assign(
+        metric_display=display,
+        # Place labels just above the bars, offset relative to the metric's range
+        label_y=display + 0.02 * np.nanmax(display, initial=0.0),
+        metric_label=[label_format(value) for value in values],
+    )
     
     # Create a single position_dodge object for alignment
     dodge_position = position_dodge(width=0.87)
@@ -267,10 +459,7 @@ def create_comparison_plot(
         + geom_col(stat="identity", position=dodge_position, show_legend=True)
         # 2a. Add text labels on top of bars
         + geom_text(
-            aes(
-                label="metric_label",
-                y=stage("metric_display", after_scale="y+0.02")
-            ),
+            aes(label="metric_label", y="label_y"),
             position=dodge_position,
             va="bottom",
             size=9,
@@ -314,19 +503,195 @@ def create_comparison_plot(
     if config["y_limits"] is not None:
         plot = plot + coord_cartesian(ylim=config["y_limits"])  # type: ignore
     
+    plot.save(output_file, dpi=dpi)
+    return plot
+
+
+def create_faceted_comparison_plot(
+    df: pd.DataFrame,
+    metrics: list[str] = ["accuracy", "total_tokens", "average_turns", "duration_seconds"],
+    output_file: Optional[str] = None,
+    skip_if_newer_than: Optional[list[str]] = None,
+    prepared: bool = False,
+    dpi: int = 150,
+    use_plotnine: bool = False,
+):
+    """
+    Create one bar chart with a facet per metric comparing 'think' vs 'no think' tools.
+    
+    Builds and renders a single plot instead of one plot per metric.
+    
+    Args:
+        df: DataFrame with columns: model, tools, total_samples, and the metrics
+        metrics: List of metric column names, one facet each
+        output_file: Path to save the output plot (defaults to visuals directory)
+        skip_if_newer_than: If given, skip the plot when output_file is newer than
+            these files and this script
+        prepared: If True, df was already passed through prepare_dataframe
+        dpi: Resolution of the saved image
+        use_plotnine: Render with plotnine instead of drawing the bars with matplotlib
+    """
+    if output_file is None:
+        output_file = os.path.join(get_visuals_dir(), "compare_all.png")
+    
+    if skip_if_newer_than is not None and _up_to_date(output_file, __file__, *skip_if_newer_than):
+        print(f"Plot is up to date, skipping: {output_file}")
+        return
+    
+    if df.empty:
+        print("No data to plot")
+        return
+    
+    missing = [metric for metric in metrics if metric not in df.columns]
+    if missing:
+        print(f"Error: Metrics {missing} not found in dataframe")
+        return
+    
+    if not prepared:
+        df = prepare_dataframe(df)
+    
+    print("\nData to plot:")
+    print(df[["model", "tools", *metrics, "total_samples"]])
+    
+    if use_plotnine:
+        plot = _plotnine_faceted_plot(df, metrics, output_file, dpi)
+        print(f"\nPlot saved to: {output_file}")
+        return plot
+    
+    plt = _pyplot()
+    
+    # One panel per metric, two per row
+    nrows = (len(metrics) + 1) // 2
+    fig, axes = plt.subplots(nrows, 2, figsize=(16, 6 * nrows), squeeze=False)
+    for ax, metric in zip(axes.flat, metrics):
+        _draw_bar_comparison(ax, df, metric, compact=True)
+        ax.set_title(str(METRIC_CONFIG.get(metric, {}).get("display", metric)), fontsize=12, fontweight='bold')
+        ax.set_ylabel("")
+    for ax in axes.flat[len(metrics):]:
+        ax.set_visible(False)
+    
+    # Add title, subtitle and legend
+    fig.suptitle("Think Tool on GAIA level 1 Benchmark", fontsize=16, fontweight='bold', y=0.99)
+    fig.text(0.5, 0.965, f"50 samples per model | with and without the 'think' tool | {datetime.now().strftime('%B %d, %Y')}",
+             ha='center', va='top', fontsize=11, color='#666666')
+    # Legend at the very bottom, below the rotated model labels of the last row
+    fig.legend(*axes.flat[0].get_legend_handles_labels(), loc='lower center', ncol=2, fontsize=11, frameon=False)
+    fig.subplots_adjust(bottom=0.16, top=0.92, left=0.08, right=0.98, hspace=0.5, wspace=0.2)
+    
     # Save the plot
-    plot.save(output_file, dpi=300)
+    fig.savefig(output_file, dpi=dpi, facecolor='white')
+    plt.close(fig)
     print(f"\nPlot saved to: {output_file}")
     
+    return fig
+
+
+def _plotnine_faceted_plot(df: pd.DataFrame, metrics: list[str], output_file: str, dpi: int):
+    """Save the chart of create_faceted_comparison_plot with plotnine (facet_wrap)."""
+    from plotnine import (
+        aes,
+        as_labeller,
+        element_line,
+        element_text,
+        facet_wrap,
+        geom_col,
+        geom_text,
+        ggplot,
+        labs,
+        position_dodge,
+        scale_fill_brewer,
+        theme,
+        theme_minimal,
+    )
+    import numpy as np
+
+    # Long format: one row per (model, tools, metric)
+    long_df = df.melt(
+        id_vars=["model", "tools", "total_samples"],
+        value_vars=metrics,
+        var_name="metric",
+        value_name="value",
+    )
+    
+    # Create display column and labels per metric
+    values = long_df["value"].to_numpy(dtype=float)
+    display = values.copy()
+    labels = np.empty(len(long_df), dtype=object)
+    offsets = np.zeros(len(long_df))
+    metric_values = long_df["metric"].to_numpy()
+    for metric in metrics:
+        config = METRIC_CONFIG.get(metric, METRIC_CONFIG["accuracy"])
+        mask = metric_values == metric
+        if config["add_min_value"]:
+            # show zero values as a small bar
+            display[mask & (display == 0)] = config["min_value"]
+        label_format = str(config["label_format"]).format
+        labels[mask] = [label_format(value) for value in values[mask]]
+        # Place labels just above the bars, offset relative to the metric's range
+        offsets[mask] = 0.02 * np.nanmax(display[mask], initial=0.0)
+    long_df = long_df.assign(
+        metric=pd.Categorical(metric_values, categories=metrics, ordered=True),
+        metric_display=display,
+        label_y=display + offsets,
+        metric_label=labels,
+    )
+    
+    facet_labels = {
+        metric: str(METRIC_CONFIG.get(metric, {}).get("display", metric)) for metric in metrics
+    }
+    
+    # Create a single position_dodge object for alignment
+    dodge_position = position_dodge(width=0.87)
+    
+    plot = (
+        ggplot(long_df, aes(x="model", y="metric_display", fill="tools"))
+        + geom_col(stat="identity", position=dodge_position, show_legend=True)
+        + geom_text(
+            aes(label="metric_label", y="label_y"),
+            position=dodge_position,
+            va="bottom",
+            size=7,
+        )
+        + facet_wrap("metric", scales="free_y", ncol=2, labeller=as_labeller(facet_labels))
+        + scale_fill_brewer(type="qualitative", palette="Set2")
+        + labs(
+            title="Think Tool on GAIA level 1 Benchmark",
+            subtitle=f"50 samples per model | with and without the 'think' tool | {datetime.now().strftime('%B %d, %Y')}",
+            y="",
+            x="",
+            fill="",
+        )
+        + theme_minimal()
+        + theme(
+            panel_grid_major_y=element_line(color="#d0d0d0", size=0.5),
+            panel_grid_minor_y=element_line(color="#e8e8e8", size=0.25),
+            panel_grid_major_x=element_line(color="none"),
+            panel_grid_minor_x=element_line(color="none"),
+            plot_title=element_text(size=16, weight="bold"),
+            plot_subtitle=element_text(size=11, color="#666666"),
+            strip_text=element_text(size=12, weight="bold"),
+            axis_text_x=element_text(rotation=45, hjust=1, size=9),
+            legend_position="bottom",
+            legend_direction="horizontal",
+            figure_size=(16, 12),
+        )
+    )
+    
+    plot.save(output_file, dpi=dpi)
     return plot
 
 
+def _render_plot(plot_fn: Callable, df: pd.DataFrame, **kwargs) -> None:
+    """Create a plot, discarding the returned figure (it may not be picklable)."""
+    plot_fn(df, **kwargs)
+
+
 def load_or_create_dataframe(cache_file: str, force_refresh: bool = False) -> pd.DataFrame:
     """
     Load dataframe from cache file if it exists, otherwise process logs and save to cache.
     
     Args:
-        cache_file: Path to the cache CSV file
+        cache_file: Path to the cache Parquet file
         force_refresh: If True, ignore cache and reprocess logs
         
     Returns:
@@ -335,33 +700,43 @@ def load_or_create_dataframe(cache_file: str, force_refresh: bool = False) -> pd
     # Check if cache file exists and we're not forcing a refresh
     if os.path.exists(cache_file) and not force_refresh:
         print(f"Loading cached data from: {cache_file}")
-        df = pd.read_csv(cache_file)
+        df = pd.read_parquet(cache_file, columns=_USED_COLUMNS)
         print(f"Loaded {len(df)} rows from cache")
         return df
     
+    # Fall back to a cache saved in the older CSV format, converting it to Parquet
+    legacy_cache_file = os.path.splitext(cache_file)[0] + ".csv"
+    if os.path.exists(legacy_cache_file) and not force_refresh:
+        print(f"Loading cached data from: {legacy_cache_file}")
+        df = pd.read_csv(legacy_cache_file, dtype={"model": "category"})
+        print(f"Loaded {len(df)} rows from cache")
+        df.to_parquet(cache_file, index=False, compression="zstd")
+        print(f"Converted cache to: {cache_file}")
+        return df[_USED_COLUMNS]
+    
     # Find folders that match the regex pattern
-    log_folders = [
-        f for f in os.listdir(".") 
-        if (
-            os.path.isdir(f) and 
-            re.match(r"logs[2|3]?_gaia_level1_50_(default|think)$", f)
-        )
-    ]
+    with os.scandir(".") as entries:
+        log_folders = [
+            entry.name for entry in entries
+            if _LOG_DIR_RE.match(entry.name) and entry.is_dir()
+        ]
     
     print(f"Found log folders: {log_folders}")
     
     if not log_folders:
         print("No matching log folders found!")
-        print("Looking for folders matching pattern: logs[2|3]?_gaia_level1_50_(default|think)")
+        print(f"Looking for folders matching pattern: {_LOG_DIR_RE.pattern}")
         return pd.DataFrame()
     
     # Create dataframe from logs
+    from report_logs import read_logs_into_table  # type: ignore
+
     print("Processing logs...")
     df = read_logs_into_table(log_folders)
     
     if not df.empty:
         # Save to cache file
-        df.to_csv(cache_file, index=False)
+        df.to_parquet(cache_file, index=False, compression="zstd")
         print(f"Saved {len(df)} rows to cache: {cache_file}")
     
     return df
@@ -383,42 +758,122 @@ def load_or_create_dataframe(cache_file: str, force_refresh: bool = False) -> pd
     is_flag=True,
     help="Generate parallel coordinates plots for each model"
 )
-def main(refresh: bool, bar_charts: bool, parallel_coords: bool) -> None:
+@click.option(
+    "--per-metric",
+    is_flag=True,
+    help="Save one bar chart per metric instead of a single faceted chart"
+)
+@click.option(
+    "--plotnine",
+    "use_plotnine",
+    is_flag=True,
+    help="Render bar charts with plotnine instead of matplotlib"
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of processes used to create plots (default: number of CPUs, 1 to run serially)"
+)
+@click.option(
+    "--hi-dpi",
+    is_flag=True,
+    help="Save plots at 300 dpi instead of 150 dpi"
+)
+@click.option(
+    "--force-replot",
+    is_flag=True,
+    help="Regenerate plots even if they are newer than the cached data and this script "
+    "(implied by --hi-dpi, --plotnine and --per-metric)"
+)
+def main(
+    refresh: bool,
+    bar_charts: bool,
+    parallel_coords: bool,
+    per_metric: bool,
+    use_plotnine: bool,
+    jobs: Optional[int],
+    hi_dpi: bool,
+    force_replot: bool,
+) -> None:
     """Generate comparison plots for think tool evaluation."""
     # If no specific plot type is requested, generate all
     generate_all = not bar_charts and not parallel_coords
     
     # Define cache file path in the same directory as this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    cache_file = os.path.join(script_dir, "logs_data.csv")
+    cache_file = os.path.join(_SCRIPT_DIR, "logs_data.parquet")
     
     # Load or create dataframe
     df = load_or_create_dataframe(cache_file, force_refresh=refresh)
     
+    # Plots newer than the cached data (and this script) are skipped unless forced.
+    # Existing plots don't record how they were rendered, so explicitly passed
+    # render options also recreate them
+    render_options = hi_dpi or use_plotnine or per_metric
+    skip_if_newer_than = None if (force_replot or refresh or render_options) else [cache_file]
+    
     if df.empty:
         print("No data found")
-    else:
-        # Create bar chart comparison plots for all metrics
-        if generate_all or bar_charts:
-            metrics = ["accuracy", "total_tokens", "average_turns", "duration_seconds"]
-            
-            for metric in metrics:
-                print(f"\n{'='*60}")
-                print(f"Creating bar chart for: {metric}")
-                print('='*60)
-                create_comparison_plot(df, metric=metric)
+        return
+    
+    dpi = 300 if hi_dpi else 150
+    
+    # Collect the plots to create, each one is independent of the others
+    plots: list[tuple[str, Callable, pd.DataFrame, dict]] = []
+    
+    # Create bar chart comparison plots for all metrics
+    if generate_all or bar_charts:
+        metrics = ["accuracy", "total_tokens", "average_turns", "duration_seconds"]
+        # Prepare the data once for all bar charts
+        prepared_df = prepare_dataframe(df)
         
-        # Create parallel coordinates plots for all models
-        if generate_all or parallel_coords:
-            models = sorted(df["model"].unique())
-            
-            for model in models:
-                print(f"\n{'='*60}")
-                print(f"Creating parallel coordinates plot for: {model}")
-                print('='*60)
-                create_parallel_coordinates_plot(df, model_name=model)
-
+        if per_metric:
+            for metric in metrics:
+                plots.append((
+                    f"bar chart for: {metric}",
+                    create_comparison_plot,
+                    prepared_df,
+                    {"metric": metric, "prepared": True, "use_plotnine": use_plotnine},
+                ))
+        else:
+            plots.append((
+                f"bar chart for: {', '.join(metrics)}",
+                create_faceted_comparison_plot,
+                prepared_df,
+                {"metrics": metrics, "prepared": True, "use_plotnine": use_plotnine},
+            ))
+    
+    # Create parallel coordinates plots for all models, splitting the rows by
+    # model in one groupby pass and normalizing with one min/max reduction
+    if generate_all or parallel_coords:
+        metric_range = parallel_coords_metric_range(df, PARALLEL_COORDS_METRICS)
+        for model, model_df in df.groupby("model", sort=True, observed=True):
+            plots.append((
+                f"parallel coordinates plot for: {model}",
+                create_parallel_coordinates_plot,
+                df,
+                {"model_name": model, "model_df": model_df, "metric_range": metric_range},
+            ))
+    
+    if jobs == 1 or len(plots) == 1:
+        for description, plot_fn, plot_df, kwargs in plots:
+            print(f"\n{'='*60}")
+            print(f"Creating {description}")
+            print('='*60)
+            _render_plot(plot_fn, plot_df, skip_if_newer_than=skip_if_newer_than, dpi=dpi, **kwargs)
+        return
+    
+    # Rendering is CPU-bound, so plots are created in separate processes
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _render_plot, plot_fn, plot_df, skip_if_newer_than=skip_if_newer_than, dpi=dpi, **kwargs
+            ): description
+            for description, plot_fn, plot_df, kwargs in plots
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"Finished {futures[future]}")
 
 if __name__ == "__main__":
     main()
-
@@ -1,26 +1,106 @@
+import importlib.metadata
+import operator
 import os
 import re
 import json
 import requests
+import tempfile
+import time
 import pandas as pd
-from inspect_ai.log import EvalSample, list_eval_logs, read_eval_log
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from requests.adapters import HTTPAdapter
+from inspect_ai.log import EvalLog, EvalLogInfo, EvalSample, list_eval_logs, read_eval_log
 from inspect_ai.model import ChatMessageAssistant, ModelUsage
 
-from datetime import datetime
+# Cached log rows are rebuilt when inspect_ai or the row format changes
+_INSPECT_VERSION = importlib.metadata.version("inspect_ai")
+_ROW_FORMAT = 3
 
-def parse_time(t: str | datetime) -> datetime | None:
-    if isinstance(t, datetime):
-        return t
+# Mistral model list cache, and a single-connection session with timeouts for the API
+_MISTRAL_MODELS_CACHE = os.path.join(
+    os.path.expanduser("~"), ".cache", "inspect_examples", "mistral_models.json"
+)
+_MISTRAL_MODELS_TTL = 3600
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# Shared zero usage for logs without usage for their model (only ever read)
+_EMPTY_USAGE = ModelUsage()
+
+# Columns of the table built by read_logs_into_table and their dtypes
+COLUMN_DTYPES = {
+    "model": "string",
+    "tools": "string",
+    "dataset": "category",
+    "subset": "category",
+    "total_samples": "int32",
+    "average_turns": "float32",
+    "duration_seconds": "float32",
+    "total_tokens": "int64",
+    "accuracy": "float32",
+}
+COLUMNS = tuple(COLUMN_DTYPES)
+
+# Fields of a row built from one log; start and end times become duration_seconds
+_ROW_FIELDS = (
+    "model", "tools", "dataset", "subset", "total_samples",
+    "average_turns", "started_at", "completed_at", "total_tokens", "accuracy",
+)
+
+# Arrow types of the row fields (dictionary-encoded dataset and subset become categoricals)
+_ROW_SCHEMA = pa.schema([
+    ("model", pa.string()),
+    ("tools", pa.string()),
+    ("dataset", pa.dictionary(pa.int8(), pa.string())),
+    ("subset", pa.dictionary(pa.int8(), pa.string())),
+    ("total_samples", pa.int32()),
+    ("average_turns", pa.float32()),
+    ("started_at", pa.string()),
+    ("completed_at", pa.string()),
+    ("total_tokens", pa.int64()),
+    ("accuracy", pa.float32()),
+])
+
+# Log folders produced by gaia_eval.py, e.g. logs2_gaia_level1_50_think
+_LOG_DIR_RE = re.compile(r"logs[23]?_gaia_level1_50_(default|think)$")
+
+def _read_cached_mistral_models(ttl: float) -> list[str] | None:
+    """Return the cached Mistral model IDs if the cache file is younger than ttl seconds."""
     try:
-        return datetime.fromisoformat(t)
-    except Exception:
+        if time.time() - os.path.getmtime(_MISTRAL_MODELS_CACHE) >= ttl:
+            return None
+        with open(_MISTRAL_MODELS_CACHE) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
         return None
 
-def list_mistral_models() -> list[str]:
+
+def _write_cached_mistral_models(models: list[str]) -> None:
+    """Write the Mistral model IDs to the cache file atomically."""
+    cache_dir = os.path.dirname(_MISTRAL_MODELS_CACHE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as f:
+            json.dump(models, f)
+        os.replace(f.name, _MISTRAL_MODELS_CACHE)
+    except OSError as e:
+        print(f"Warning: could not cache Mistral models: {e}")
+
+
+def list_mistral_models(ttl: float = _MISTRAL_MODELS_TTL) -> list[str]:
     """
     List available Mistral models using the Mistral API via requests.
     Returns a list of model IDs.
+    
+    The list is cached in ~/.cache/inspect_examples/mistral_models.json and
+    reused for ttl seconds (pass 0 to always call the API).
     """
+    cached = _read_cached_mistral_models(ttl)
+    if cached is not None:
+        return cached
+
     api_key = os.environ.get("MISTRAL_API_KEY")
     if not api_key:
         print("Warning: MISTRAL_API_KEY environment variable not set.")
@@ -32,14 +112,18 @@ def list_mistral_models() -> list[str]:
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers, timeout=(3, 10))
         response.raise_for_status()
+        # Decode the body once, and report the decoded keys rather than re-reading the text
         response_json = response.json()
         
-        if "data" in response_json:
-             return [model["id"] for model in response_json["data"]]
+        if isinstance(response_json, dict) and "data" in response_json:
+            models = [model["id"] for model in response_json["data"]]
+            _write_cached_mistral_models(models)
+            return models
         else:
-            print(f"Unexpected response format from Mistral API: {response.text}")
+            keys = list(response_json) if isinstance(response_json, dict) else type(response_json).__name__
+            print(f"Unexpected response format from Mistral API: {keys}")
             return []
     except requests.RequestException as e:
         print(f"Error calling Mistral API: {e}")
@@ -49,84 +133,174 @@ def list_mistral_models() -> list[str]:
         return []
 
 
-def read_logs_into_table(log_folders: list[str]) -> pd.DataFrame:
-    # Collect data from all logs
-    data = []
+def _average_turns(samples: list[EvalSample] | None) -> float | None:
+    """Average number of assistant turns per sample in the log."""
+    if not samples:
+        return None
+    # Count in one pass, without building per-sample lists
+    turns_total = 0
+    n_samples_seen = 0
+    # Local names for the classes checked in the loops
+    is_sample, is_assistant = EvalSample, ChatMessageAssistant
+    for sample in samples:
+        if isinstance(sample, is_sample):
+            turns_total += sum(1 for message in sample.messages if isinstance(message, is_assistant))
+            n_samples_seen += 1
+    # Samples counted in the same pass, so filtered or failed samples can't skew the average
+    return turns_total / max(n_samples_seen, 1)
+
+
+def _log_row(tools_label: str, log: EvalLog) -> dict | None:
+    """Build the table row for one eval log, or None if the log has no results.
+    
+    Counting turns needs the sample messages, so log is read in full; its
+    header fields come from the same read.
+    """
+    # Extract metrics scores (overall)
+    # if log.status == "success" and log.results is not None:
+    results = log.results
+    if results is None:
+        return None
+    stats = log.stats
+    eval_ = log.eval
+    scores = results.scores
+
+    total_samples = results.total_samples        
+    accuracy = scores[0].metrics["accuracy"].value
+
+    model_name = eval_.model
+    # Raw start and end times, parsed for all logs at once in read_logs_into_table
+    started_at = stats.started_at
+    completed_at = stats.completed_at
+
+    model_usage: ModelUsage = stats.model_usage.get(model_name) or _EMPTY_USAGE
+    total_tokens = model_usage.total_tokens
+    
+    average_turns = _average_turns(log.samples)
+
+    return {
+        "model": model_name,
+        "tools": tools_label,
+        "dataset": eval_.dataset.name,
+        "subset": eval_.task_display_name,
+        "total_samples": total_samples,
+        "average_turns": average_turns,
+        "started_at": started_at,
+        "completed_at": completed_at,
+        "total_tokens": total_tokens,
+        "accuracy": accuracy,
+    }
+
+
+def _read_log_row(folder: str, tools_label: str, eval_log_info: EvalLogInfo) -> dict | None:
+    """Read the table row for an eval log, using the folder's .cache when it is current.
+    
+    Rows are cached in <folder>/.cache/<log file>.parquet together with the
+    modification time and size of the log they were built from and the
+    inspect_ai version and row format that built them.
+    """
+    cache_path = os.path.join(
+        folder, ".cache", f"{os.path.basename(eval_log_info.name)}.parquet"
+    )
+    cache_key = {
+        "log_mtime": eval_log_info.mtime,
+        "log_size": eval_log_info.size,
+        "inspect_version": _INSPECT_VERSION,
+        "row_format": _ROW_FORMAT,
+    }
+    if os.path.exists(cache_path):
+        try:
+            cached = pd.read_parquet(cache_path)
+        except (OSError, pa.ArrowInvalid):
+            # Truncated or corrupt (e.g. left by an interrupted run), rebuild it
+            cached = None
+        if cached is not None and not cached.empty and all(
+            key in cached.columns and cached[key].iloc[0] == value
+            for key, value in cache_key.items()
+        ):
+            return cached.drop(columns=list(cache_key)).to_dict("records")[0]
+
+    row = _log_row(tools_label, read_eval_log(eval_log_info))
+    if row is None:
+        return None
+
+    # Write to a temporary file and move it into place, so readers (and
+    # concurrent runs) never see a partially written cache file
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as f:
+        pd.DataFrame([{**row, **cache_key}]).to_parquet(f, index=False)
+    os.replace(f.name, cache_path)
+    return row
+
+
+def _iter_tasks(log_folders: list[str]) -> Iterator[tuple[str, str, EvalLogInfo]]:
+    """Yield (folder, tools label, eval log info) for each log.
+    
+    Folders are listed lazily, so the first logs are read while later folders
+    are listed. The tools label is derived once per folder.
+    """
     for folder in log_folders:
+        tools_label = "default" if folder.endswith("_default") else "with think"
         for eval_log_info in list_eval_logs(log_dir=folder):
-            log = read_eval_log(eval_log_info)
-
-            # Extract metrics scores (overall)
-            # if log.status == "success" and log.results is not None:
-            if log.results is not None:
-                metrics_dict = {}
-                for score in log.results.scores:
-                    for metric_name, metric in score.metrics.items():
-                        metrics_dict[f"{score.name}_{metric_name}"] = metric.value
-                total_samples = log.results.total_samples        
-                completed_samples = log.results.completed_samples
-                accuracy = log.results.scores[0].metrics["accuracy"].value
-
-                model_name = log.eval.model
-                # Compute duration in seconds between started_at and completed_at
-                # Assume started_at and completed_at are either datetime or ISO string (handle both)
-                started_at = log.stats.started_at
-                completed_at = log.stats.completed_at
-                s = parse_time(started_at)
-                e = parse_time(completed_at)
-                duration_seconds = (e - s).total_seconds() if s and e else None
-
-                model_usage: ModelUsage = log.stats.model_usage.get(model_name, ModelUsage())
-                input_tokens = model_usage.input_tokens
-                output_tokens = model_usage.output_tokens
-                total_tokens = model_usage.total_tokens
-                reasoning_tokens = model_usage.reasoning_tokens
-                
-                average_turns = None
-                if log.samples:
-                    turns = [0] * completed_samples
-                    for i, sample in enumerate(log.samples):
-                        if isinstance(sample, EvalSample):
-                            turns[i] = sum([1 if isinstance(message, ChatMessageAssistant) else 0 for message in sample.messages])
-                    average_turns = sum(turns) / completed_samples if completed_samples > 0 else 0
-
-                data.append({
-                    # "folder": folder,
-                    "model": model_name,
-                    "tools": "default" if folder.endswith("_default") else "with think",
-                    "dataset": log.eval.dataset.name,
-                    "subset": log.eval.task_display_name,
-                    "total_samples": total_samples,
-                    # "completed_samples": completed_samples,
-                    "average_turns": average_turns,
-                    "duration_seconds": duration_seconds,
-                    # "input_tokens": input_tokens,
-                    # "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
-                    # "reasoning_tokens": reasoning_tokens,
-                    "accuracy": accuracy,
-                    # **metrics_dict,
-                })
-
-    return pd.DataFrame(data)
+            yield folder, tools_label, eval_log_info
+
+
+def _iter_rows(log_folders: list[str], max_workers: int | None = None) -> Iterator[tuple]:
+    """Yield the row of each log with results as a tuple of _ROW_FIELDS, in log order."""
+    # Collect data from all logs, reading them concurrently (each log is independent)
+    tasks = _iter_tasks(log_folders)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    row_values = operator.itemgetter(*_ROW_FIELDS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() keeps the rows in log order
+        for row in executor.map(lambda task: _read_log_row(*task), tasks):
+            if row is not None:
+                yield row_values(row)
+
+
+def read_logs_into_table(log_folders: list[str], max_workers: int | None = None) -> pd.DataFrame:
+    # Build the columns as an Arrow table, then convert with one block per column
+    # (no consolidation copy); strings become the "string" dtype of COLUMN_DTYPES
+    columns = list(zip(*_iter_rows(log_folders, max_workers))) or [()] * len(_ROW_FIELDS)
+    table = pa.table(dict(zip(_ROW_FIELDS, columns)), schema=_ROW_SCHEMA)
+    df = table.to_pandas(
+        split_blocks=True, types_mapper={pa.string(): pd.StringDtype()}.get
+    )
+
+    # Parse the ISO 8601 timestamps of all logs at once (unparseable ones become NaT)
+    started = pd.to_datetime(df["started_at"], format="ISO8601", errors="coerce", utc=True)
+    completed = pd.to_datetime(df["completed_at"], format="ISO8601", errors="coerce", utc=True)
+    df["duration_seconds"] = (completed - started).dt.total_seconds().astype("float32")
+
+    return df[list(COLUMNS)]
+
+
+def _find_log_folders(path: str = ".") -> list[str]:
+    """Names of the log folders in path that match _LOG_DIR_RE."""
+    with os.scandir(path) as entries:
+        return [
+            entry.name for entry in entries
+            if _LOG_DIR_RE.match(entry.name) and entry.is_dir()
+        ]
+
 
 if __name__ == "__main__":
-    # List Mistral models
-    print("Available Mistral Models:")
-    models = list_mistral_models()
-    for model in models:
-        print(f" - {model}")
-    print("-" * 20)
-
-    # Find folders that match the regex pattern 
-    log_folders = [
-        f for f in os.listdir(".") 
-        if (
-            os.path.isdir(f) and 
-            re.match(r"logs[2|3]?_gaia_level1_50_(default|think)$", f)
-        )
-    ]
-
-    # Create dataframe and print
-    df = read_logs_into_table(log_folders)
+    # The Mistral API call and the folder scan are independent, run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        models_future = executor.submit(list_mistral_models)
+        folders_future = executor.submit(_find_log_folders)
+
+        # Start reading the logs as soon as the folders are found
+        df_future = executor.submit(read_logs_into_table, folders_future.result())
+
+        # List Mistral models while the logs are read
+        print("Available Mistral Models:")
+        for model in models_future.result():
+            print(f" - {model}")
+        print("-" * 20)
+
+        # Create dataframe and print
+        df = df_future.result()
     print(df)